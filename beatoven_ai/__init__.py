@@ -3,6 +3,8 @@ Beatoven.ai music generation package.
 
 This package provides simple access to the Beatoven.ai API for AI-powered music generation.
 """
+import asyncio
+from typing import Dict, Tuple
 
 from beatoven_ai.beatoven_ai.cli import main
 from beatoven_ai.beatoven_ai.client import BeatovenAIError, BeatovenClient
@@ -21,9 +23,42 @@ __all__ = [
     "logger",
     "setup_logger",
     "main",
-    "generate_music"
+    "generate_music",
+    "aclose"
 ]
 
+# Shared clients keyed by (api_key, env_file), so repeated generate_music
+# calls reuse one client and therefore one connection pool, instead of
+# paying client init and session setup per call
+_clients: Dict[Tuple, BeatovenClient] = {}
+
+
+def _get_client(api_key: str = None, env_file: str = None) -> BeatovenClient:
+    """Get (or create) the shared client for the given credentials."""
+    key = (api_key, env_file)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = BeatovenClient(api_key=api_key, env_file=env_file)
+    return client
+
+
+async def aclose() -> None:
+    """
+    Close the shared clients created by generate_music.
+
+    Call this before the event loop shuts down; otherwise the pooled
+    sessions are garbage-collected unclosed and aiohttp logs
+    "Unclosed client session" warnings.
+    """
+    for client in _clients.values():
+        await client.aclose()
+
+
+# In-flight generate_music tasks keyed by request parameters, so concurrent
+# identical requests coalesce into a single API round-trip
+_inflight: Dict[Tuple, "asyncio.Task"] = {}
+
+
 # Convenience function for simple API access
 async def generate_music(
     prompt: str,
@@ -49,11 +84,20 @@ async def generate_music(
     Returns:
         Path to the downloaded music file
     """
-    client = BeatovenClient(api_key=api_key, env_file=env_file)
-    return await client.generate_music(
-        prompt=prompt,
-        duration=duration,
-        format=format,
-        output_path=output_path,
-        filename=filename
-    )
\ No newline at end of file
+    client = _get_client(api_key=api_key, env_file=env_file)
+
+    # Coalesce concurrent identical requests onto one shared task
+    key = (prompt, duration, format, output_path, filename, api_key, env_file)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(client.generate_music(
+            prompt=prompt,
+            duration=duration,
+            format=format,
+            output_path=output_path,
+            filename=filename
+        ))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    return await task
\ No newline at end of file
@@ -81,7 +81,13 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         default=None,
         help='日志文件路径'
     )
-    
+
+    parser.add_argument(
+        '--no-uvloop',
+        action='store_true',
+        help='禁用 uvloop 事件循环（用于调试）'
+    )
+
     return parser.parse_args(args)
 
 
@@ -102,12 +108,14 @@ async def main_async(args: argparse.Namespace) -> int:
         log_file=args.log_file
     )
     
+    client = None
+
     try:
         # Create client with API key from args or config
         client = BeatovenClient(api_key=args.api_key)
-        
+
         # Generate music
-        logger.info(f"Generating music with prompt: {args.prompt}")
+        logger.info("Generating music with prompt: %s", args.prompt)
         output_path = await client.generate_music(
             prompt=args.prompt,
             duration=args.duration,
@@ -115,26 +123,31 @@ async def main_async(args: argparse.Namespace) -> int:
             output_path=args.output,
             filename=args.filename
         )
-        
-        logger.info(f"Music generated successfully! File saved to: {output_path}")
+
+        logger.info("Music generated successfully! File saved to: %s", output_path)
         print(f"\n✅ 音乐已生成: {output_path}")
         return 0
-        
+
     except BeatovenAIError as e:
-        logger.error(f"Failed to generate music: {str(e)}")
+        logger.error("Failed to generate music: %s", e)
         print(f"\n❌ 生成失败: {str(e)}")
         return 1
-        
+
     except KeyboardInterrupt:
         logger.info("Process interrupted by user")
         print("\n🛑 已取消")
         return 130
-        
+
     except Exception as e:
         logger.exception("Unexpected error occurred")
         print(f"\n❌ 发生错误: {str(e)}")
         return 1
 
+    finally:
+        # Release the connection pool before the event loop shuts down
+        if client is not None:
+            await client.aclose()
+
 
 def main(args: Optional[List[str]] = None) -> int:
     """
@@ -147,6 +160,16 @@ def main(args: Optional[List[str]] = None) -> int:
         Exit code
     """
     parsed_args = parse_args(args)
+
+    # Use the libuv-backed event loop when available; it gives a sizable
+    # throughput boost on aiohttp workloads and is a drop-in replacement
+    if not parsed_args.no_uvloop:
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
     return asyncio.run(main_async(parsed_args))
 
 
@@ -2,15 +2,30 @@
 Client module for interacting with the Beatoven.ai API.
 """
 import asyncio
+import json
+import random
+import time
+import uuid
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
 import aiofiles
 import aiohttp
+from pydantic import ValidationError
 
-from .config import get_settings, settings
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used when absent
+    orjson = None
+
+from .config import get_settings, settings_fast
 from .logger import logger
-from .models import TaskResponse, TextPrompt, TrackRequest, TrackStatus
+from .models import TRACK_STATUS_ADAPTER, TaskResponse, TextPrompt, TrackRequest, TrackStatus
+
+# Fastest available JSON decoder for response bodies. Both decoders accept
+# raw bytes, so feeding them response.read() directly skips the intermediate
+# bytes-to-str copy that response.json() would make for every poll.
+_json_loads = json.loads if orjson is None else orjson.loads
 
 
 class BeatovenAIError(Exception):
@@ -18,6 +33,11 @@ class BeatovenAIError(Exception):
     pass
 
 
+class _LongPollUnsupported(Exception):
+    """Internal signal that the API does not honour long-poll requests."""
+    pass
+
+
 class BeatovenClient:
     """
     Client for interfacing with the Beatoven.ai API.
@@ -32,8 +52,9 @@ class BeatovenClient:
             api_key: Optional API key. If not provided, will use the one from settings.
             env_file: Optional path to a custom .env file. If provided, will load settings from this file.
         """
-        # Load custom settings if env_file is provided, otherwise use the global settings
-        self.settings = get_settings(env_file) if env_file else settings.settings
+        # Load custom settings if env_file is provided, otherwise use the
+        # cached validation-free snapshot of the global settings
+        self.settings = get_settings(env_file) if env_file else settings_fast()
         
         # Use the provided API key or the one from settings
         self.api_key = api_key or self.settings.API_KEY
@@ -42,7 +63,77 @@ class BeatovenClient:
         # Validate API key
         if not self.api_key:
             raise ValueError("API key is required. Set it in the .env file or pass it to the constructor.")
-    
+
+        # Build the auth header once instead of per request
+        self._auth_headers = {"Authorization": f"Bearer {self.api_key}"}
+
+        # Snapshot hot settings fields so request loops read plain
+        # attributes instead of going through pydantic's model machinery
+        self._request_timeout = self.settings.REQUEST_TIMEOUT
+        self._download_timeout = self.settings.DOWNLOAD_TIMEOUT
+        self._max_poll_interval = float(self.settings.MAX_POLL_INTERVAL)
+        self._poll_interval = min(
+            float(self.settings.POLLING_INTERVAL), self._max_poll_interval
+        )
+
+        # Shared HTTP session, created lazily on first use so that the client
+        # can be constructed outside of a running event loop. The loop it
+        # was created on is tracked so a client surviving across
+        # asyncio.run invocations doesn't reuse a dead-loop session.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Whether the API honours long-poll status requests (None = unknown)
+        self._long_poll_supported: Optional[bool] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared aiohttp session, creating it on first use.
+
+        Reusing one session keeps a keep-alive connection pool across
+        composition, polling and download requests, avoiding repeated
+        TCP/TLS handshakes.
+
+        Returns:
+            The shared aiohttp client session
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is not None
+            and not self._session.closed
+            and self._session_loop is not None
+            and self._session_loop is not loop
+        ):
+            # The session belongs to a previous event loop (e.g. an earlier
+            # asyncio.run call). Its connections are unusable on this loop,
+            # so drop it; closing it here would touch the dead loop.
+            self._session = None
+        if self._session is None or self._session.closed:
+            session_kwargs = {}
+            if orjson is not None:
+                session_kwargs["json_serialize"] = lambda o: orjson.dumps(o).decode()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_read=self._request_timeout
+                ),
+                **session_kwargs
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session and its connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     async def compose_track(
         self, 
         session: aiohttp.ClientSession,
@@ -61,85 +152,135 @@ class BeatovenClient:
         Raises:
             BeatovenAIError: If the composition request fails
         """
-        logger.info(f"Sending composition request: {request_data}")
+        logger.info("Sending composition request: %s", request_data)
         
-        # Convert to dict if it's a Pydantic model
+        # Convert to dict if it's a Pydantic model; plain dicts pass through
+        # untouched so callers can pre-serialize once and retry cheaply
         if isinstance(request_data, TrackRequest):
-            data = request_data.model_dump()
+            data = request_data.model_dump(mode="json")
         else:
             data = request_data
-        
+
         try:
             async with session.post(
                 f"{self.api_url}/tracks/compose",
                 json=data,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                timeout=self.settings.REQUEST_TIMEOUT
+                headers=self._auth_headers,
+                timeout=self._request_timeout
             ) as response:
-                response_data = await response.json()
+                response_data = _json_loads(await response.read())
                 
                 if response.status != 200 or not response_data.get("task_id"):
-                    logger.error(f"Composition failed: {response_data}")
+                    logger.error("Composition failed: %s", response_data)
                     raise BeatovenAIError(f"Composition failed: {response_data}")
                 
-                logger.info(f"Composition request successful: {response_data}")
+                logger.info("Composition request successful: %s", response_data)
                 return TaskResponse(task_id=response_data["task_id"])
                 
         except aiohttp.ClientConnectionError as e:
-            logger.error(f"Connection error: {str(e)}")
+            logger.error("Connection error: %s", e)
             raise BeatovenAIError(f"Could not connect to Beatoven.ai: {str(e)}") from e
             
         except aiohttp.ClientError as e:
-            logger.error(f"HTTP error: {str(e)}")
+            logger.error("HTTP error: %s", e)
             raise BeatovenAIError(f"HTTP error: {str(e)}") from e
             
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
+            logger.error("Unexpected error: %s", e)
             raise BeatovenAIError(f"Unexpected error: {str(e)}") from e
 
-    async def get_track_status(self, session: aiohttp.ClientSession, task_id: str) -> TrackStatus:
+    async def _get_task_bytes(self, session: aiohttp.ClientSession, task_id: str) -> bytes:
         """
-        Get the status of a track generation task.
-        
+        Fetch the raw task status body.
+
         Args:
             session: aiohttp client session
             task_id: Task ID from the compose_track response
-            
+
         Returns:
-            Track status information
-            
+            Raw JSON body from the task endpoint
+
         Raises:
             BeatovenAIError: If the status request fails
         """
-        logger.debug(f"Checking status for task: {task_id}")
-        
+        logger.debug("Checking status for task: %s", task_id)
+
         try:
             async with session.get(
                 f"{self.api_url}/tasks/{task_id}",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                timeout=self.settings.REQUEST_TIMEOUT
+                headers=self._auth_headers,
+                timeout=self._request_timeout
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    logger.debug(f"Task status: {data}")
-                    return TrackStatus(**data)
+                    return await response.read()
                 else:
                     error_text = await response.text()
-                    logger.error(f"Status check failed: {error_text}")
+                    logger.error("Status check failed: %s", error_text)
                     raise BeatovenAIError(f"Status check failed: {error_text}")
-                    
+
         except aiohttp.ClientConnectionError as e:
-            logger.error(f"Connection error: {str(e)}")
+            logger.error("Connection error: %s", e)
             raise BeatovenAIError(f"Could not connect: {str(e)}") from e
-            
+
         except aiohttp.ClientError as e:
-            logger.error(f"HTTP error: {str(e)}")
+            logger.error("HTTP error: %s", e)
             raise BeatovenAIError(f"HTTP error: {str(e)}") from e
-            
+
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
+            logger.error("Unexpected error: %s", e)
             raise BeatovenAIError(f"Unexpected error: {str(e)}") from e
 
+    async def _get_task_json(self, session: aiohttp.ClientSession, task_id: str) -> Dict[str, Any]:
+        """
+        Fetch the raw task status payload without model validation.
+
+        Used by the polling loop, which only inspects the "status" key and
+        doesn't need a full TrackStatus built on every iteration.
+
+        Args:
+            session: aiohttp client session
+            task_id: Task ID from the compose_track response
+
+        Returns:
+            Raw JSON payload from the task endpoint
+
+        Raises:
+            BeatovenAIError: If the status request fails or the body is not JSON
+        """
+        body = await self._get_task_bytes(session, task_id)
+        try:
+            data = _json_loads(body)
+        except ValueError as e:  # json and orjson decode errors both subclass this
+            logger.error("Invalid JSON in status response: %s", e)
+            raise BeatovenAIError(f"Invalid JSON in status response: {str(e)}") from e
+        logger.debug("Task status: %s", data)
+        return data
+
+    async def get_track_status(self, session: aiohttp.ClientSession, task_id: str) -> TrackStatus:
+        """
+        Get the status of a track generation task.
+
+        The body bytes are parsed and validated in one step by
+        pydantic-core, with no intermediate Python dict.
+
+        Args:
+            session: aiohttp client session
+            task_id: Task ID from the compose_track response
+
+        Returns:
+            Track status information
+
+        Raises:
+            BeatovenAIError: If the status request fails or the body is not a
+                valid status payload
+        """
+        body = await self._get_task_bytes(session, task_id)
+        try:
+            return TRACK_STATUS_ADAPTER.validate_json(body)
+        except ValidationError as e:
+            logger.error("Invalid status response: %s", e)
+            raise BeatovenAIError(f"Invalid status response: {str(e)}") from e
+
     async def handle_track_file(
         self, 
         session: aiohttp.ClientSession,
@@ -168,9 +309,9 @@ class BeatovenClient:
         output_dir = Path(output_path or self.settings.OUTPUT_DIR)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Generate filename if not provided
+        # Generate a collision-free filename if not provided
         if not filename:
-            filename = f"composed_track_{asyncio.get_event_loop().time():.0f}"
+            filename = f"composed_track_{uuid.uuid4().hex[:12]}"
         
         # Ensure filename has the correct extension
         if not filename.endswith(f".{format}"):
@@ -179,67 +320,236 @@ class BeatovenClient:
         # Full path for saving the file
         file_path = output_dir / filename
         
-        logger.info(f"Downloading track to {file_path}")
+        logger.info("Downloading track to %s", file_path)
         
         try:
-            async with session.get(track_url, timeout=self.settings.DOWNLOAD_TIMEOUT) as response:
+            async with session.get(track_url, timeout=self._download_timeout) as response:
                 if response.status == 200:
+                    # Stream to disk in 64 KiB chunks so network reads overlap
+                    # disk writes and memory stays bounded for large files.
+                    # Writes are coalesced to ~1 MiB because every aiofiles
+                    # write is a round-trip through the thread-pool executor.
+                    buf = bytearray()
                     async with aiofiles.open(file_path, "wb") as f:
-                        await f.write(await response.read())
-                    logger.info(f"Successfully downloaded track to {file_path}")
+                        async for chunk in response.content.iter_chunked(65536):
+                            buf += chunk
+                            if len(buf) >= 1 << 20:
+                                await f.write(buf)
+                                buf = bytearray()
+                        if buf:
+                            await f.write(buf)
+                    logger.info("Successfully downloaded track to %s", file_path)
                     return str(file_path)
                 else:
                     error_text = await response.text()
-                    logger.error(f"Download failed: {error_text}")
+                    logger.error("Download failed: %s", error_text)
                     raise BeatovenAIError(f"Download failed: {error_text}")
                     
         except aiohttp.ClientConnectionError as e:
-            logger.error(f"Connection error while downloading: {str(e)}")
+            logger.error("Connection error while downloading: %s", e)
             raise BeatovenAIError(f"Could not download file: {str(e)}") from e
             
         except aiohttp.ClientError as e:
-            logger.error(f"HTTP error while downloading: {str(e)}")
+            logger.error("HTTP error while downloading: %s", e)
             raise BeatovenAIError(f"HTTP error: {str(e)}") from e
             
         except Exception as e:
-            logger.error(f"Unexpected error while downloading: {str(e)}")
+            logger.error("Unexpected error while downloading: %s", e)
             raise BeatovenAIError(f"Unexpected error: {str(e)}") from e
 
+    async def _prewarm_download_host(self, session: aiohttp.ClientSession, track_url: str) -> None:
+        """
+        Warm up DNS and TLS to the download host with a HEAD request.
+
+        The track usually lives on a CDN distinct from the API host; doing
+        the handshake during the last polling window means the real
+        download starts on an already-pooled connection. Failures are
+        ignored — the actual download reports its own errors.
+
+        Args:
+            session: aiohttp client session
+            track_url: URL the track will be downloaded from
+        """
+        try:
+            async with session.head(track_url, timeout=aiohttp.ClientTimeout(total=10)):
+                pass
+        except Exception:
+            logger.debug("Download host pre-warm failed for %s", track_url)
+
+    async def watch_task_status_longpoll(
+        self,
+        session: aiohttp.ClientSession,
+        task_id: str
+    ) -> TrackStatus:
+        """
+        Wait for task completion using long-poll requests.
+
+        Each request asks the server to hold the response for up to 30s,
+        so a single suspended request replaces many short polls.
+
+        Args:
+            session: aiohttp client session
+            task_id: Task ID to monitor
+
+        Returns:
+            Final track status
+
+        Raises:
+            _LongPollUnsupported: If the API ignores or rejects the wait
+                parameter, or times out repeatedly
+            BeatovenAIError: If the task fails or the request errors out
+        """
+        consecutive_timeouts = 0
+
+        while True:
+            started = time.monotonic()
+
+            try:
+                async with session.get(
+                    f"{self.api_url}/tasks/{task_id}",
+                    params={"wait": 30},
+                    headers=self._auth_headers,
+                    timeout=aiohttp.ClientTimeout(total=35)
+                ) as response:
+                    if response.status in (400, 405):
+                        raise _LongPollUnsupported()
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logger.error("Status check failed: %s", error_text)
+                        raise BeatovenAIError(f"Status check failed: {error_text}")
+                    data = _json_loads(await response.read())
+
+            except asyncio.TimeoutError:
+                # Server held the connection past our deadline. Ask again a
+                # couple of times, then give up on long polling — an endless
+                # retry loop here could hang forever against a stalled server
+                consecutive_timeouts += 1
+                if consecutive_timeouts >= 3:
+                    logger.warning("Long-poll requests for task %s keep timing out", task_id)
+                    raise _LongPollUnsupported()
+                continue
+
+            except ValueError as e:  # json and orjson decode errors both subclass this
+                logger.error("Invalid JSON in status response: %s", e)
+                raise BeatovenAIError(f"Invalid JSON in status response: {str(e)}") from e
+
+            except aiohttp.ClientConnectionError as e:
+                logger.error("Connection error: %s", e)
+                raise BeatovenAIError(f"Could not connect: {str(e)}") from e
+
+            except aiohttp.ClientError as e:
+                logger.error("HTTP error: %s", e)
+                raise BeatovenAIError(f"HTTP error: {str(e)}") from e
+
+            consecutive_timeouts = 0
+
+            if data.get("status") == "composing":
+                # A "composing" answer well before the 30s hold window ends
+                # means the wait parameter was ignored; without this check a
+                # slow-but-not-holding server would be re-polled back-to-back
+                # at full rate. Fall back to paced backoff polling instead.
+                if time.monotonic() - started < 25.0:
+                    raise _LongPollUnsupported()
+                logger.debug("Task %s is still composing...", task_id)
+            elif data.get("status") == "failed":
+                logger.error("Task %s has failed", task_id)
+                raise BeatovenAIError("Task failed")
+            else:
+                logger.info("Task %s has completed", task_id)
+                return self._validate_track_status(data)
+
+    def _validate_track_status(self, data: Dict[str, Any]) -> TrackStatus:
+        """
+        Build a TrackStatus from a raw terminal payload.
+
+        Args:
+            data: Decoded task status payload
+
+        Returns:
+            Validated track status
+
+        Raises:
+            BeatovenAIError: If the payload is not a valid status
+        """
+        try:
+            return TRACK_STATUS_ADAPTER.validate_python(data)
+        except ValidationError as e:
+            logger.error("Invalid status response: %s", e)
+            raise BeatovenAIError(f"Invalid status response: {str(e)}") from e
+
     async def watch_task_status(
-        self, 
+        self,
         session: aiohttp.ClientSession,
-        task_id: str, 
+        task_id: str,
         interval: int = None
     ) -> TrackStatus:
         """
         Poll the task status until it completes or fails.
-        
+
+        Polling uses exponential backoff with a small random jitter: checks
+        start frequent to catch fast completions early, then back off up to
+        MAX_POLL_INTERVAL to avoid hammering the API on long tracks.
+
         Args:
             session: aiohttp client session
             task_id: Task ID to monitor
-            interval: Polling interval in seconds
-            
+            interval: Initial polling delay in seconds (defaults to the
+                POLLING_INTERVAL setting)
+
         Returns:
             Final track status
-            
+
         Raises:
             BeatovenAIError: If the task fails
         """
-        polling_interval = interval or self.settings.POLLING_INTERVAL
-        logger.info(f"Watching task {task_id} with {polling_interval}s polling interval")
-        
+        # USE_LONG_POLL=True forces long polling (no silent fallback),
+        # False disables it, None auto-detects and remembers the answer
+        forced = self.settings.USE_LONG_POLL is True
+        use_long_poll = self.settings.USE_LONG_POLL
+        if use_long_poll is None:
+            use_long_poll = self._long_poll_supported is not False
+
+        if use_long_poll:
+            try:
+                track_status = await self.watch_task_status_longpoll(session, task_id)
+                self._long_poll_supported = True
+                return track_status
+            except _LongPollUnsupported as e:
+                if forced:
+                    raise BeatovenAIError(
+                        "Long polling was forced via USE_LONG_POLL but the API does not support it"
+                    ) from e
+                self._long_poll_supported = False
+                logger.info("Long polling not supported by the API, falling back to backoff polling")
+
+        delay = float(interval) if interval else self._poll_interval
+        max_delay = self._max_poll_interval
+        logger.info("Watching task %s with backoff polling (up to %.0fs)", task_id, max_delay)
+
+        prewarm_task = None
+
         while True:
-            track_status = await self.get_track_status(session, task_id)
-            
-            if track_status.status == "composing":
-                logger.info(f"Task {task_id} is still composing...")
-                await asyncio.sleep(polling_interval)
-            elif track_status.status == "failed":
-                logger.error(f"Task {task_id} has failed")
+            # Inspect the raw payload; only build a TrackStatus on exit so
+            # model validation doesn't run on every polling iteration
+            data = await self._get_task_json(session, task_id)
+
+            if data.get("status") == "composing":
+                # If the track URL is already known, warm up the connection
+                # to the download host while we wait for composition
+                track_url = (data.get("meta") or {}).get("track_url")
+                if track_url and prewarm_task is None:
+                    prewarm_task = asyncio.ensure_future(
+                        self._prewarm_download_host(session, track_url)
+                    )
+                logger.debug("Task %s is still composing...", task_id)
+                await asyncio.sleep(delay)
+                delay = min(delay * 1.7 + random.uniform(0, 0.25), max_delay)
+            elif data.get("status") == "failed":
+                logger.error("Task %s has failed", task_id)
                 raise BeatovenAIError("Task failed")
             else:
-                logger.info(f"Task {task_id} has completed")
-                return track_status
+                logger.info("Task %s has completed", task_id)
+                return self._validate_track_status(data)
 
     async def generate_music(
         self,
@@ -275,35 +585,36 @@ class BeatovenClient:
             format=format
         )
         
-        logger.info(f"Generating music with prompt: {prompt}, duration: {duration}s, format: {format}")
+        logger.info("Generating music with prompt: %s, duration: %ss, format: %s", prompt, duration, format)
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                # Step 1: Start composition
-                compose_response = await self.compose_track(session, track_request)
-                task_id = compose_response.task_id
-                logger.info(f"Composition started with task ID: {task_id}")
-                
-                # Step 2: Wait for completion
-                final_status = await self.watch_task_status(session, task_id)
-                
-                if final_status.meta and "track_url" in final_status.meta:
-                    track_url = final_status.meta["track_url"]
-                    
-                    # Step 3: Download the file
-                    return await self.handle_track_file(
-                        session, 
-                        track_url, 
-                        output_path=output_path,
-                        filename=filename,
-                        format=format
-                    )
-                else:
-                    raise BeatovenAIError("No track URL in the completion response")
-                    
-            except BeatovenAIError:
-                # Let these pass through
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error in generate_music: {str(e)}")
-                raise BeatovenAIError(f"Music generation failed: {str(e)}") from e
\ No newline at end of file
+        session = await self._get_session()
+
+        try:
+            # Step 1: Start composition
+            compose_response = await self.compose_track(session, track_request)
+            task_id = compose_response.task_id
+            logger.info("Composition started with task ID: %s", task_id)
+
+            # Step 2: Wait for completion
+            final_status = await self.watch_task_status(session, task_id)
+
+            if final_status.meta and "track_url" in final_status.meta:
+                track_url = final_status.meta["track_url"]
+
+                # Step 3: Download the file
+                return await self.handle_track_file(
+                    session,
+                    track_url,
+                    output_path=output_path,
+                    filename=filename,
+                    format=format
+                )
+            else:
+                raise BeatovenAIError("No track URL in the completion response")
+
+        except BeatovenAIError:
+            # Let these pass through; keep the session alive for retries
+            raise
+        except Exception as e:
+            logger.error("Unexpected error in generate_music: %s", e)
+            raise BeatovenAIError(f"Music generation failed: {str(e)}") from e
\ No newline at end of file
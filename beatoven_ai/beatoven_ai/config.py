@@ -1,12 +1,19 @@
 """
 Configuration module with environment variable support.
 """
+import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
-from pydantic import Field, Extra
+from typing import Optional, Union
+
+try:
+    from typing import Annotated
+except ImportError:  # Python 3.8: provided by typing_extensions (a pydantic dependency)
+    from typing_extensions import Annotated
+
+from dotenv import dotenv_values
+from pydantic import Field, TypeAdapter
 from pydantic_settings import BaseSettings, SettingsConfigDict
-import os
 
 
 class Settings(BaseSettings):
@@ -50,23 +57,39 @@ class Settings(BaseSettings):
         description="Download timeout in seconds"
     )
     POLLING_INTERVAL: int = Field(
-        default=10,
-        description="Interval in seconds between status checks"
+        default=1,
+        description="Initial delay in seconds between status checks (grows up to MAX_POLL_INTERVAL)"
+    )
+    MAX_POLL_INTERVAL: int = Field(
+        default=15,
+        description="Maximum backoff delay in seconds between status checks"
+    )
+    USE_LONG_POLL: Optional[bool] = Field(
+        default=None,
+        description="Force long-poll status watching on/off (None auto-detects)"
     )
     
     # Allow extra fields so we can load from env files with additional variables
     model_config = SettingsConfigDict(
+        env_prefix="BEATOVEN_",
+        case_sensitive=False,
+        env_file_encoding="utf-8",
         extra="ignore",  # Allow extra fields and ignore them
+        frozen=True,  # Settings are read-only after construction
     )
 
 
+@lru_cache(maxsize=None)
 def find_env_file(default_name: str = ".env") -> Optional[Path]:
     """
     Find the .env file by looking in several common locations.
-    
+
+    The result is cached so the stat() calls for each candidate location
+    only run once per process.
+
     Args:
         default_name: Default environment file name to look for
-        
+
     Returns:
         Path to the found env file or None if not found
     """
@@ -95,80 +118,198 @@ def find_env_file(default_name: str = ".env") -> Optional[Path]:
 
 # Cache the settings objects to avoid recreating them
 @lru_cache(maxsize=32)
-def get_settings(env_file: Optional[Union[str, Path]] = None) -> Settings:
+def _get_settings_cached(env_file: Optional[Path] = None) -> Settings:
     """
-    Create and return a Settings instance with optional custom env file path.
-    
+    Build a Settings instance for a normalized env file path.
+
+    The env file is passed through the _env_file init kwarg, which
+    pydantic-settings supports natively, so no per-call Settings subclass
+    (and therefore no schema rebuild) is needed.
+
     Args:
-        env_file: Optional path to a custom .env file. Can be string or Path object.
-               If None, will search for ".env" in common locations.
-    
+        env_file: Resolved path to a custom .env file, or None to search
+               for ".env" in common locations.
+
     Returns:
         Settings instance configured with the specified env file
     """
-    config_dict = {
-        "env_file_encoding": "utf-8",
-        "env_prefix": "BEATOVEN_",
-        "case_sensitive": False,
-        "extra": "ignore",  # Allow extra fields in the env file
-    }
-    
     if env_file is not None:
-        # Convert to Path if it's a string
-        if isinstance(env_file, str):
-            env_file = Path(env_file).resolve()
-            
         # Ensure the file exists
-        if env_file.exists():
-            config_dict["env_file"] = str(env_file)
-            # Don't print anything if the file exists - let the caller handle messaging
-        else:
+        if not env_file.exists():
             print(f"Warning: Specified environment file {env_file} not found. Using default settings without any env file.")
+            env_file = None
+        # Don't print anything if the file exists - let the caller handle messaging
     else:
         # Only search for .env file if no specific file was provided
-        found_env_file = find_env_file()
-        if found_env_file:
-            config_dict["env_file"] = str(found_env_file)
-            print(f"Using environment file: {found_env_file}")
-    
-    # Create a new Settings class with the dynamic model_config
-    class DynamicSettings(Settings):
-        model_config = SettingsConfigDict(**config_dict)
-    
-    return DynamicSettings()
+        env_file = find_env_file()
+        if env_file:
+            print(f"Using environment file: {env_file}")
+
+    return Settings(_env_file=str(env_file) if env_file else None)
+
+
+def get_settings(env_file: Optional[Union[str, Path]] = None) -> Settings:
+    """
+    Create and return a Settings instance with optional custom env file path.
+
+    Results are memoized: the env file path is resolved before the cache
+    lookup, so string and Path arguments naming the same file share one
+    cached instance instead of re-parsing the .env file.
+
+    Args:
+        env_file: Optional path to a custom .env file. Can be string or Path object.
+               If None, will search for ".env" in common locations.
+
+    Returns:
+        Settings instance configured with the specified env file
+    """
+    if env_file is not None:
+        env_file = Path(env_file).resolve()
+    return _get_settings_cached(env_file)
+
+
+# Let tests reset memoized settings between cases
+get_settings.cache_clear = _get_settings_cached.cache_clear
+
+
+@lru_cache(maxsize=1)
+def settings_fast() -> Settings:
+    """
+    Get an unvalidated snapshot of the default settings.
+
+    The snapshot is rebuilt with Settings.model_construct, which assigns
+    fields directly and skips pydantic-core validation entirely. Since the
+    values are copied from the fully validated global settings, the
+    snapshot is safe for code that reads settings in hot paths and
+    shouldn't pay validator cost — BeatovenClient uses it when no custom
+    env file is given.
+
+    Returns:
+        A Settings instance built without validation
+    """
+    return Settings.model_construct(**settings.settings.model_dump())
+
+
+@lru_cache(maxsize=32)
+def _env_file_values(env_path: Optional[Path] = None) -> dict:
+    """
+    Parse an env file once and cache its values.
+
+    Note these values are only used for single-field lazy lookups; they are
+    deliberately not fed to Settings(**values), because init kwargs outrank
+    real environment variables in pydantic-settings and would invert the
+    expected precedence.
+
+    Args:
+        env_path: Env file to parse; None discovers one via find_env_file
+
+    Returns:
+        Mapping of upper-cased keys to raw string values (empty if no file)
+    """
+    if env_path is None:
+        env_path = find_env_file()
+    if env_path is None:
+        return {}
+    return {k.upper(): v for k, v in dotenv_values(env_path).items()}
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(name: str) -> TypeAdapter:
+    """Build (and cache) a single-field validator for a Settings field."""
+    field = Settings.model_fields[name]
+    return TypeAdapter(Annotated[field.annotation, field])
+
+
+def _environ_lookup(key: str) -> Optional[str]:
+    """
+    Case-insensitive os.environ lookup.
+
+    Mirrors case_sensitive=False in the Settings model config, so e.g.
+    "beatoven_api_url" is honoured by the lazy path just like it is when
+    the full model is built. The exact key is tried first; the scan only
+    runs when that misses.
+
+    Args:
+        key: Upper-cased prefixed variable name (e.g. "BEATOVEN_API_URL")
+
+    Returns:
+        The variable's value, or None if no case variant is set
+    """
+    raw = os.environ.get(key)
+    if raw is not None:
+        return raw
+    for env_key, value in os.environ.items():
+        if env_key.upper() == key:
+            return value
+    return None
+
+
+def _resolve_single_field(name: str):
+    """
+    Resolve one Settings field without building the full model.
+
+    Looks up the prefixed environment variable (case-insensitively, like
+    pydantic-settings does), then the cached .env file values, then the
+    field default, validating only that single field.
+
+    Args:
+        name: Settings field name (e.g. "API_URL")
+
+    Returns:
+        The validated field value
+    """
+    raw = _environ_lookup(f"BEATOVEN_{name}")
+    if raw is None:
+        raw = _env_file_values().get(f"BEATOVEN_{name}")
+    if raw is None:
+        return Settings.model_fields[name].get_default(call_default_factory=True)
+    return _field_adapter(name).validate_python(raw)
 
 
 # Create a lazy-loaded settings property
 class LazySettings:
     """Lazy-loaded settings that only get initialized when accessed."""
     _instance = None
-    
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._settings = None
         return cls._instance
-    
+
     @property
     def settings(self):
         """Get or create the settings instance."""
         if self._settings is None:
             self._settings = get_settings()
         return self._settings
-    
+
     def __getattr__(self, name):
-        """Forward attribute access to the settings object."""
-        return getattr(self.settings, name)
+        """Resolve a settings attribute lazily, caching the result."""
+        if self._settings is None and name in Settings.model_fields:
+            # Full model not built yet: validate just this field so light
+            # consumers (e.g. CLI --help) never parse the other env vars.
+            # Not cached on the instance — once the full model is built it
+            # is authoritative and must not be shadowed by lazy values.
+            return _resolve_single_field(name)
+        value = getattr(self.settings, name)
+        # Cache on the instance so repeated lookups skip this indirection
+        self.__dict__[name] = value
+        return value
 
 
 # Export a lazy-loaded global settings instance
 settings = LazySettings()
 
-# For backward compatibility, define constants as properties
+# For backward compatibility, define constants as properties. The getters
+# are memoized so the resolved strings are computed once and then read as
+# plain constants instead of going through settings attribute machinery.
+@lru_cache(maxsize=1)
 def get_backend_v1_api_url():
     """Get API URL from settings lazily."""
     return settings.API_URL
 
+@lru_cache(maxsize=1)
 def get_backend_api_header_key():
     """Get API key from settings lazily, with fallback."""
     return settings.API_KEY or "-xBRMpR9cjzS8cwQFF53Dw"
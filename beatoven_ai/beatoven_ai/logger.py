@@ -3,10 +3,48 @@ Logging configuration for the beatoven_ai package.
 """
 import logging
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=1)
+def _format_second(second: int, datefmt: str) -> str:
+    """Format a whole second once; bursts within the same second reuse it."""
+    return time.strftime(datefmt, time.localtime(second))
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that caches the rendered timestamp per whole second.
+
+    The configured date format has second resolution, so records emitted
+    within the same second can share one strftime result instead of
+    re-rendering it per record.
+    """
+
+    def formatTime(self, record, datefmt=None):
+        return _format_second(int(record.created), datefmt or self.datefmt)
+
+
+# Shared formatter, built once at import. Formatter is stateless, so all
+# handlers can safely share this single instance.
+_FORMATTER = _CachedTimeFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Log directories already created this process, so repeated setups with
+# different configs but the same directory skip the stat/mkdir syscalls
+_prepared_log_dirs = set()
+
+# Configuration currently applied to each logger name. Tracked here rather
+# than memoizing setup_logger itself: the side effects live on the shared
+# Logger object, so only the *latest* applied config is a valid reason to
+# skip work — alternating configs must reconfigure every time.
+_applied_configs = {}
+
+
 def setup_logger(
     name: str = "beatoven_ai",
     log_level: int = logging.INFO,
@@ -16,6 +54,10 @@ def setup_logger(
     """
     Configure and return a logger with the specified settings.
 
+    If the logger already carries exactly this configuration (common in
+    tests and re-imports), it is returned as-is instead of rebuilding the
+    handlers and re-opening the log file.
+
     Args:
         name: Logger name
         log_level: Logging level (default: INFO)
@@ -26,11 +68,12 @@ def setup_logger(
         Configured logger instance
     """
     logger = logging.getLogger(name)
+
+    config = (log_level, log_file, console)
+    if _applied_configs.get(name) == config:
+        return logger
     logger.setLevel(log_level)
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = _FORMATTER
 
     # Remove existing handlers to avoid duplicate logging
     if logger.hasHandlers():
@@ -39,7 +82,9 @@ def setup_logger(
     # Add file handler if requested
     if log_file:
         log_path = Path(log_file).resolve()
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        if log_path.parent not in _prepared_log_dirs:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            _prepared_log_dirs.add(log_path.parent)
         file_handler = logging.FileHandler(log_path)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
@@ -49,7 +94,8 @@ def setup_logger(
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
-    
+
+    _applied_configs[name] = config
     return logger
 
 
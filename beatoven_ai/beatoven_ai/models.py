@@ -3,7 +3,7 @@ Pydantic models for beatoven_ai package.
 """
 from typing import Any, Dict, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class TextPrompt(BaseModel):
@@ -26,4 +26,10 @@ class TaskResponse(BaseModel):
 class TrackStatus(BaseModel):
     """Model representing the status of a track generation task."""
     status: Literal["composing", "composed", "completed", "failed"] = Field(..., description="Current status of the task")
-    meta: Optional[Dict[str, Any]] = Field(None, description="Additional metadata, including track_url when completed")
\ No newline at end of file
+    meta: Optional[Dict[str, Any]] = Field(None, description="Additional metadata, including track_url when completed")
+
+# Precompiled validators for hot-path parsing. Reusing one TypeAdapter goes
+# straight to pydantic-core instead of the model __init__ path, which
+# matters for the status payload parsed on every poll.
+TRACK_REQUEST_ADAPTER = TypeAdapter(TrackRequest)
+TRACK_STATUS_ADAPTER = TypeAdapter(TrackStatus)
@@ -3,25 +3,25 @@ Debug script to test the beatoven_ai package.
 """
 import asyncio
 import logging
-import sys
 
-from beatoven_ai import generate_music, logger
+import beatoven_ai
+from beatoven_ai import generate_music, setup_logger
 from beatoven_ai.beatoven_ai.config import settings
 
 
 async def main():
-    # Set up logging to stdout
-    logger.setLevel(logging.DEBUG)
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(logging.DEBUG)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-    
-    # Print settings for debugging
-    print(f"API URL: {settings.API_URL}")
-    print(f"API KEY: {settings.API_KEY[:5]}...{settings.API_KEY[-4:]}")
-    print(f"OUTPUT DIR: {settings.OUTPUT_DIR}")
+    # Set up debug logging to stdout; setup_logger reuses the package's
+    # shared module-level formatter instead of building one inline
+    setup_logger(log_level=logging.DEBUG)
+
+    # Print settings for debugging; bind to locals so each field is only
+    # read through the settings machinery once
+    api_url = settings.API_URL
+    api_key = settings.API_KEY
+    output_dir = settings.OUTPUT_DIR
+    print(f"API URL: {api_url}")
+    print(f"API KEY: {api_key[:5]}...{api_key[-4:]}")
+    print(f"OUTPUT DIR: {output_dir}")
     
     try:
         # Test music generation
@@ -37,7 +37,23 @@ async def main():
         print(f"Error: {type(e).__name__}: {str(e)}")
         import traceback
         traceback.print_exc()
+    finally:
+        # Close the convenience function's pooled client
+        await beatoven_ai.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Prefer the libuv-backed loop when available, matching the CLI
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    # Reuse one event loop instead of asyncio.run's build-and-teardown,
+    # so repeated main() invocations (e.g. smoke-test loops) stay cheap
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
\ No newline at end of file
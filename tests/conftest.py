@@ -1,45 +1,137 @@
 """
-Common pytest fixtures for testing.
+Common pytest fixtures and lightweight test doubles.
 """
-from unittest.mock import AsyncMock, MagicMock
+import json
 
-import aiohttp
 import pytest
 from dotenv import load_dotenv
 
 from beatoven_ai.beatoven_ai.client import BeatovenClient
+from beatoven_ai.beatoven_ai.config import Settings, settings as global_settings
 
 # Load environment variables for testing
 load_dotenv()
 
+# Seed the lazy global settings with an unvalidated default snapshot.
+# model_construct skips pydantic-core validation and .env discovery, so
+# unit tests never pay the full pydantic-settings construction cost.
+global_settings._settings = Settings.model_construct(**{
+    name: field.get_default(call_default_factory=True)
+    for name, field in Settings.model_fields.items()
+})
 
-@pytest.fixture
+
+class FakeResponse:
+    """Lightweight stand-in for an aiohttp response."""
+
+    def __init__(self, status=200, json_data=None, body=None, text_data="Error text"):
+        self.status = status
+        self._json = json_data if json_data is not None else {}
+        self._body = body if body is not None else json.dumps(self._json).encode()
+        self._text = text_data
+        self.content = _FakeContent(self._body)
+
+    async def json(self, **kwargs):
+        return self._json
+
+    async def read(self):
+        return self._body
+
+    async def text(self):
+        return self._text
+
+
+class _FakeContent:
+    """Streams a fixed body like aiohttp's StreamReader."""
+
+    def __init__(self, body):
+        self._body = body
+
+    async def iter_chunked(self, n):
+        for i in range(0, len(self._body), n):
+            yield self._body[i:i + n]
+
+    async def read(self):
+        return self._body
+
+
+class _FakeRequestCM:
+    """Async context manager yielding a fake response.
+
+    If the configured "response" is an exception instance, it is raised on
+    entry instead, mimicking a request that fails before producing a
+    response (e.g. a timeout).
+    """
+
+    def __init__(self, response):
+        self._response = response
+
+    async def __aenter__(self):
+        if isinstance(self._response, BaseException):
+            raise self._response
+        return self._response
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class FakeSession:
+    """Fake aiohttp session that records requests and answers each one
+    with the configured response.
+
+    A list of responses is consumed in order, with the last one repeated
+    for any further requests; exception instances in the list are raised
+    instead of returned.
+    """
+
+    closed = False
+
+    def __init__(self, response=None, responses=None):
+        if responses is not None:
+            self._responses = list(responses)
+        else:
+            self._responses = [response if response is not None else FakeResponse()]
+        self.calls = []
+
+    @property
+    def response(self):
+        return self._responses[0]
+
+    def _next_response(self):
+        if len(self._responses) > 1:
+            return self._responses.pop(0)
+        return self._responses[0]
+
+    def post(self, url, **kwargs):
+        self.calls.append(("POST", url, kwargs))
+        return _FakeRequestCM(self._next_response())
+
+    def get(self, url, **kwargs):
+        self.calls.append(("GET", url, kwargs))
+        return _FakeRequestCM(self._next_response())
+
+    def head(self, url, **kwargs):
+        self.calls.append(("HEAD", url, kwargs))
+        return _FakeRequestCM(FakeResponse())
+
+
+@pytest.fixture(scope="session")
 def api_key():
     """Provide a test API key."""
     return "test_api_key"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(api_key):
-    """Create a client instance with a test API key."""
-    return BeatovenClient(api_key=api_key)
-
+    """Shared client instance with a test API key.
 
-@pytest.fixture
-def mock_session():
-    """Mock aiohttp ClientSession."""
-    session = MagicMock(spec=aiohttp.ClientSession)
-    session.__aenter__ = AsyncMock(return_value=session)
-    session.__aexit__ = AsyncMock(return_value=None)
-    return session
+    Session-scoped so the settings/validator cost is paid once for the
+    whole suite; tests that mutate the client should build their own.
+    """
+    return BeatovenClient(api_key=api_key)
 
 
 @pytest.fixture
-def mock_response():
-    """Create a mock response object."""
-    response = MagicMock()
-    response.status = 200
-    response.json = AsyncMock(return_value={})
-    response.text = AsyncMock(return_value="")
-    response.read = AsyncMock(return_value=b"")
-    return response
\ No newline at end of file
+def fake_session():
+    """A fake session answering every request with an empty 200 response."""
+    return FakeSession()